@@ -1,15 +1,17 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import sqlite3
 from datetime import datetime
 import re
-from typing import List, Dict
-import pandas as pd
-from google.oauth2.credentials import Credentials
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import queue
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, Tuple
 import os
 import hashlib
+import hmac
+import functools
 import json
 import time
 
@@ -29,15 +31,28 @@ PROJECT_STATUSES = {
     }
 }
 
-# Authentication credentials (hardcoded for demo - in production, use environment variables)
-# Get admin credentials from secrets
-ADMIN_USERNAME = st.secrets["admin_credentials"]["username"]
-ADMIN_PASSWORD = st.secrets["admin_credentials"]["password"]  # Store the hashed password in secrets
-
 # Google Sheets setup
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 SPREADSHEET_ID = '1zsObh657CzgZgxMhS9qR9Psm64VP9tnu6I1mqzMm2ZI'
+SHEET_TITLE = 'Projects'
 RANGE_NAME = 'Projects!A2:I'  # Updated range to include status column
+_ROW_RANGE_FMT = 'Projects!A{0}:I{0}'.format  # Full row for a given row number
+NAME_RANGE = 'Projects!A2:A'  # Project name column only
+SHEETS_BATCH_WINDOW = 0.5  # Seconds to collect writes before flushing them together
+
+# +[country code (1-3 digits)][10-digit number]
+_WHATSAPP_RE = re.compile(r'^\+\d{11,13}$')
+
+# SQLite database file
+DB_PATH = 'ai_projects.db'
+READER_POOL_SIZE = 4
+
+@st.cache_resource(show_spinner=False)
+def _get_admin_creds() -> Tuple[bytes, bytes]:
+    """Admin username (lowercased) and password hash from secrets, as bytes"""
+    creds = st.secrets["admin_credentials"]
+    # The password secret holds the SHA-256 hex digest, not the plain password
+    return creds["username"].lower().encode(), creds["password"].encode()
 
 def check_password():
     """Returns `True` if the user had the correct password."""
@@ -54,8 +69,13 @@ def check_password():
     password = st.text_input("Password", type="password")
     
     if st.button("Login"):
-        if username.lower() == ADMIN_USERNAME and \
-           hashlib.sha256(password.encode()).hexdigest() == ADMIN_PASSWORD:
+        admin_username, admin_password_hash = _get_admin_creds()
+        # Compare both fields in constant time so neither leaks via timing
+        username_ok = hmac.compare_digest(username.lower().encode(), admin_username)
+        password_ok = hmac.compare_digest(
+            hashlib.sha256(password.encode()).hexdigest().encode(), admin_password_hash
+        )
+        if username_ok and password_ok:
             st.session_state.password_correct = True
             return True
         else:
@@ -64,18 +84,19 @@ def check_password():
             
     return False
 
-def init_google_sheets():
-    """Initialize Google Sheets connection"""
-    try:
-        credentials = service_account.Credentials.from_service_account_info(
-            st.secrets["gcp_service_account"],
-            scopes=SCOPES
-        )
-        service = build('sheets', 'v4', credentials=credentials)
-        return service
-    except Exception as e:
-        st.error(f"Error connecting to Google Sheets: {str(e)}")
-        return None
+@st.cache_resource(show_spinner=False)
+def _get_sheets_service():
+    """Build the authenticated Sheets client once per process"""
+    # Imported lazily: the Google client libraries are slow to load and only
+    # needed once a project is written
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
+    credentials = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"],
+        scopes=SCOPES
+    )
+    return build('sheets', 'v4', credentials=credentials, cache_discovery=False)
 
 # def sync_to_sheets(project_data: Dict, is_update: bool = False):
 #     """Sync project data to Google Sheets"""
@@ -115,142 +136,293 @@ def init_google_sheets():
 #         return False, f"Error syncing to Google Sheets: {str(e)}"
 
 def delete_project(project_name: str) -> tuple:
-    """Delete project from database and Google Sheets"""
+    """Delete project from database and queue its removal from Google Sheets"""
     try:
         # Delete from SQLite
-        conn = sqlite3.connect('ai_projects.db')
-        c = conn.cursor()
-        c.execute('DELETE FROM projects WHERE project_name = ?', (project_name,))
-        conn.commit()
-        conn.close()
-
-        # Delete from Google Sheets
-        service = init_google_sheets()
-        if not service:
-            return False, "Project deleted from database but failed to connect to Google Sheets"
-
-        row_number = find_row_in_sheets(service, project_name)
-        if row_number:
-            # Clear the row in Google Sheets
-            range_name = f'Projects!A{row_number}:I{row_number}'
-            service.spreadsheets().values().clear(
-                spreadsheetId=SPREADSHEET_ID,
-                range=range_name
-            ).execute()
+        with _writer() as conn:
+            c = conn.cursor()
+            c.execute('DELETE FROM projects WHERE project_name = ?', (project_name,))
+        _get_all_projects.clear()
 
-            return True, "Project successfully deleted from database and Google Sheets"
-        else:
-            return True, "Project deleted from database"
+        # Delete from Google Sheets in the background
+        queue_sheets_sync('delete', {'project_name': project_name})
+        return True, "Project deleted from database. Google Sheets will be updated shortly."
 
     except Exception as e:
         return False, f"Error deleting project: {str(e)}"
 
-def find_row_in_sheets(service, project_name):
-    """Find the row number for a project in Google Sheets"""
+def _sheet_name_index(service) -> Dict[str, int]:
+    """Map each project name in Google Sheets to its current row number.
+
+    Deliberately not cached: rows are deleted by number, so a stale index
+    would remove or overwrite the wrong project.
+    """
+    result = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=NAME_RANGE,
+        majorDimension='COLUMNS'
+    ).execute()
+
+    names = result.get('values', [[]])[0]
+    index = {}
+    for idx, name in enumerate(names):
+        index.setdefault(name, idx + 2)  # +2 because range starts at A2
+    return index
+
+@st.cache_data(show_spinner=False)
+def _projects_sheet_id(_service) -> int:
+    """Numeric ID of the Projects sheet, needed for row deletion"""
+    result = _service.spreadsheets().get(
+        spreadsheetId=SPREADSHEET_ID,
+        fields='sheets.properties(sheetId,title)'
+    ).execute()
+    for sheet in result.get('sheets', []):
+        if sheet['properties']['title'] == SHEET_TITLE:
+            return sheet['properties']['sheetId']
+    raise ValueError(f"Sheet '{SHEET_TITLE}' not found")
+
+def _sheet_row(project_data: Dict, is_update: bool) -> List[str]:
+    """Build the Google Sheets row for a project"""
+    return [
+        project_data['project_name'],
+        project_data['one_liner'],
+        project_data['description'],
+        project_data['ai_usage'],
+        project_data['lead_name'],
+        project_data['whatsapp_contact'],
+        project_data['status'],
+        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "Updated" if is_update else "New Entry"
+    ]
+
+def sync_batch_to_sheets(batch: List[Tuple[str, Dict]]) -> List[Tuple[str, str]]:
+    """Write a batch of queued changes to Google Sheets.
+
+    Changes to the same project are coalesced so only its latest state is
+    written. Returns `(project_name, message)` for every change that failed.
+    """
+    pending = {}
+    for action, project_data in batch:
+        name = project_data['project_name']
+        previous = pending.get(name, (None, None))[0]
+        if previous == 'add':
+            # Not in the sheet yet: drop it, or append the latest values
+            if action == 'delete':
+                del pending[name]
+                continue
+            action = 'add'
+        elif previous == 'delete' and action == 'update':
+            # Edited after deletion elsewhere: the row must still go
+            continue
+        elif (previous, action) in (('delete', 'add'), ('replace', 'update')):
+            # Re-registered after deletion: reuse its row if it has one,
+            # otherwise append it
+            action = 'replace'
+        pending[name] = (action, project_data)
+
+    if not pending:
+        return []
+
+    # Runs on the sync thread, where st.error would be dropped: report it instead
     try:
-        result = service.spreadsheets().values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=RANGE_NAME
-        ).execute()
-        
-        rows = result.get('values', [])
-        for idx, row in enumerate(rows):
-            if row[0] == project_name:  # First column is project name
-                return idx + 2  # +2 because range starts at A2
-        return None
+        service = _get_sheets_service()
     except Exception as e:
-        print(f"Error finding row: {str(e)}")
-        return None
+        return [(name, f"Error connecting to Google Sheets: {str(e)}") for name in pending]
 
-def sync_to_sheets(project_data: Dict, is_update: bool = False):
-    """Sync project data to Google Sheets"""
+    failures = []
     try:
-        service = init_google_sheets()
-        if not service:
-            return False, "Failed to connect to Google Sheets"
-
-        # Prepare data row
-        values = [[
-            project_data['project_name'],
-            project_data['one_liner'],
-            project_data['description'],
-            project_data['ai_usage'],
-            project_data['lead_name'],
-            project_data['whatsapp_contact'],
-            project_data['status'],
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "Updated" if is_update else "New Entry"
-        ]]
-
-        if is_update:
-            # Find existing row
-            row_number = find_row_in_sheets(service, project_data['project_name'])
-            if row_number:
-                # Update existing row
-                range_name = f'Projects!A{row_number}:I{row_number}'
-                body = {
-                    'values': values
-                }
-                service.spreadsheets().values().update(
-                    spreadsheetId=SPREADSHEET_ID,
-                    range=range_name,
-                    valueInputOption='RAW',
-                    body=body
-                ).execute()
-                return True, "Successfully updated in Google Sheets"
+        updates, deletions, appends = [], [], []
+        row_index = {}
+        if any(action != 'add' for action, _ in pending.values()):
+            row_index = _sheet_name_index(service)
+        for name, (action, project_data) in pending.items():
+            if action == 'add':
+                appends.append(_sheet_row(project_data, is_update=False))
+                continue
+
+            row_number = row_index.get(name)
+            if not row_number:
+                if action == 'update':
+                    failures.append((name, "Project not found in Google Sheets"))
+                elif action == 'replace':
+                    appends.append(_sheet_row(project_data, is_update=False))
+                continue
+
+            if action in ('update', 'replace'):
+                updates.append({
+                    'range': _ROW_RANGE_FMT(row_number),
+                    'values': [_sheet_row(project_data, is_update=True)]
+                })
             else:
-                return False, "Project not found in Google Sheets"
-        else:
-            # Append new row
-            body = {
-                'values': values
-            }
-            service.spreadsheets().values().append(
+                deletions.append(row_number)
+
+        values = service.spreadsheets().values()
+        if updates:
+            values.batchUpdate(
+                spreadsheetId=SPREADSHEET_ID,
+                body={'valueInputOption': 'RAW', 'data': updates}
+            ).execute()
+        if deletions:
+            # Remove the rows outright, bottom-up so earlier deletions don't
+            # shift the rows still to be deleted
+            sheet_id = _projects_sheet_id(service)
+            service.spreadsheets().batchUpdate(
+                spreadsheetId=SPREADSHEET_ID,
+                body={'requests': [
+                    {'deleteDimension': {'range': {
+                        'sheetId': sheet_id,
+                        'dimension': 'ROWS',
+                        'startIndex': row_number - 1,
+                        'endIndex': row_number
+                    }}}
+                    for row_number in sorted(deletions, reverse=True)
+                ]}
+            ).execute()
+        if appends:
+            values.append(
                 spreadsheetId=SPREADSHEET_ID,
                 range=RANGE_NAME,
                 valueInputOption='RAW',
                 insertDataOption='INSERT_ROWS',
-                body=body
+                body={'values': appends}
             ).execute()
-            return True, "Successfully added to Google Sheets"
-            
     except Exception as e:
-        return False, f"Error syncing to Google Sheets: {str(e)}"
+        failed = {name for name, _ in failures}
+        failures.extend(
+            (name, f"Error syncing to Google Sheets: {str(e)}")
+            for name in pending if name not in failed
+        )
+    return failures
+
+@st.cache_resource(show_spinner=False)
+def _get_sheets_worker() -> Tuple[queue.Queue, Dict[str, List[str]], threading.Lock]:
+    """Start the background Google Sheets sync thread once per process"""
+    jobs = queue.Queue()
+    failures = {}  # session ID -> failure messages not yet shown to that session
+    failures_lock = threading.Lock()
+
+    def run():
+        while True:
+            # Collect everything queued within the batch window, then flush once
+            batch = [jobs.get()]
+            deadline = time.monotonic() + SHEETS_BATCH_WINDOW
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(jobs.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Report each failure to every session that changed that project
+            sessions = {}
+            for _, project_data, session_id in batch:
+                sessions.setdefault(project_data['project_name'], set()).add(session_id)
+            changes = [(action, project_data) for action, project_data, _ in batch]
+            for name, message in sync_batch_to_sheets(changes):
+                with failures_lock:
+                    for session_id in sessions[name]:
+                        if session_id not in failures:
+                            failures[session_id] = []
+                        failures[session_id].append(f"{name}: {message}")
+
+    threading.Thread(target=run, name="sheets-sync", daemon=True).start()
+    return jobs, failures, failures_lock
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+def queue_sheets_sync(action: str, project_data: Dict):
+    """Hand a Google Sheets write ('add', 'update' or 'delete') to the sync thread"""
+    jobs, _, _ = _get_sheets_worker()
+    jobs.put((action, project_data, _session_id()))
+
+def show_sheets_sync_failures():
+    """Surface this session's background sync failures reported since the last rerun"""
+    _, failures, failures_lock = _get_sheets_worker()
+    with failures_lock:
+        session_failures = failures.pop(_session_id(), [])
+    for failure in session_failures:
+        st.toast(f"⚠️ Google Sheets sync failed for {failure}")
 
 
 
 # Database setup
+def _connect() -> sqlite3.Connection:
+    """Open a connection to the projects database in WAL mode"""
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+        "PRAGMA busy_timeout=5000; PRAGMA cache_size=-64000; "
+        "PRAGMA temp_store=MEMORY; PRAGMA foreign_keys=ON;"
+    )
+    return conn
+
+def _db_mtime() -> float:
+    """Last write time of the database, including its WAL file"""
+    mtime = os.path.getmtime(DB_PATH)
+    wal_path = DB_PATH + '-wal'
+    if os.path.exists(wal_path):
+        mtime = max(mtime, os.path.getmtime(wal_path))
+    return mtime
+
+@st.cache_resource(show_spinner=False)
+def _get_writer() -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Single shared writer connection and the lock serializing its use"""
+    return _connect(), threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def _get_reader_pool() -> queue.Queue:
+    """Bounded pool of reader connections, shared across reruns"""
+    pool = queue.Queue()
+    for _ in range(READER_POOL_SIZE):
+        conn = _connect()
+        conn.row_factory = sqlite3.Row
+        pool.put(conn)
+    return pool
+
+@contextmanager
+def _writer() -> Iterator[sqlite3.Connection]:
+    conn, lock = _get_writer()
+    with lock:
+        yield conn
+
+@contextmanager
+def _reader() -> Iterator[sqlite3.Connection]:
+    pool = _get_reader_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+@st.cache_resource(show_spinner=False)
 def init_db():
-    conn = sqlite3.connect('ai_projects.db')
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS projects (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_name TEXT UNIQUE NOT NULL,
-            one_liner TEXT NOT NULL,
-            description TEXT NOT NULL,
-            ai_usage TEXT NOT NULL,
-            lead_name TEXT NOT NULL,
-            whatsapp_contact TEXT NOT NULL,
-            status TEXT NOT NULL,
-            date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
-
-    # Add sample project if database is empty
-    conn = sqlite3.connect('ai_projects.db')
-    c = conn.cursor()
-    c.execute('SELECT COUNT(*) FROM projects')
-    count = c.fetchone()[0]
-    if count == 0:
+    with _writer() as conn:
+        c = conn.cursor()
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_name TEXT UNIQUE NOT NULL,
+                one_liner TEXT NOT NULL,
+                description TEXT NOT NULL,
+                ai_usage TEXT NOT NULL,
+                lead_name TEXT NOT NULL,
+                whatsapp_contact TEXT NOT NULL,
+                status TEXT NOT NULL,
+                date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_projects_date_added ON projects(date_added DESC)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_projects_status_date ON projects(status, date_added DESC)')
+
+        # Add sample project if database is empty
         c.execute('''
             INSERT INTO projects (
                 project_name, one_liner, description, ai_usage, 
                 lead_name, whatsapp_contact, status
-            ) VALUES (
+            )
+            SELECT
                 'Sample Project',
                 'This is a sample project',
                 'This is a sample description',
@@ -258,245 +430,361 @@ def init_db():
                 'Admin',
                 '+1234567890',
                 'Idea'
-            )
+            WHERE NOT EXISTS (SELECT 1 FROM projects)
         ''')
-        conn.commit()
-    conn.close()
 
 # [Previous validation functions remain the same]
 def validate_whatsapp(number: str) -> bool:
-    pattern = r'^\+\d{1,3}\d{10}$'
-    return bool(re.match(pattern, number))
+    return _WHATSAPP_RE.match(number) is not None
 
 def validate_one_liner(text: str) -> bool:
     return len(text) <= 250
 
 def validate_description(text: str) -> bool:
-    return len(text.split()) <= 100
+    # Split at most 100 times: a 101st token only exists if the limit is exceeded
+    return len(text.split(maxsplit=100)) <= 100
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_all_projects(db_mtime: float) -> List[Dict]:
+    """Load all projects; `db_mtime` only serves as the cache key"""
+    with _reader() as conn:
+        rows = conn.execute('SELECT * FROM projects ORDER BY date_added DESC').fetchall()
+
+    projects = [dict(row) for row in rows]
+    for project in projects:
+        # Lowercased searchable text, precomputed once for search_projects
+        project['_haystack'] = (
+            f"{project['project_name']}\x00{project['one_liner']}\x00"
+            f"{project['description']}\x00{project['lead_name']}"
+        ).lower()
+    return projects
 
 def get_all_projects() -> List[Dict]:
-    conn = sqlite3.connect('ai_projects.db')
-    df = pd.read_sql_query('SELECT * FROM projects ORDER BY date_added DESC', conn)
-    conn.close()
-    return df.to_dict('records')
+    return _get_all_projects(_db_mtime())
 
 def update_project(project_data: Dict) -> tuple:
     """Update existing project in database and sync to Google Sheets"""
     try:
-        conn = sqlite3.connect('ai_projects.db')
-        c = conn.cursor()
-        c.execute('''
-            UPDATE projects 
-            SET one_liner = ?,
-                description = ?,
-                ai_usage = ?,
-                lead_name = ?,
-                whatsapp_contact = ?,
-                status = ?,
-                last_updated = CURRENT_TIMESTAMP
-            WHERE project_name = ?
-        ''', (
-            project_data['one_liner'],
-            project_data['description'],
-            project_data['ai_usage'],
-            project_data['lead_name'],
-            project_data['whatsapp_contact'],
-            project_data['status'],
-            project_data['project_name']
-        ))
-        conn.commit()
-        conn.close()
-
-        # Sync to Google Sheets
-        sheets_success, sheets_message = sync_to_sheets(project_data, is_update=True)
-        if not sheets_success:
-            return True, f"Project updated in database, but {sheets_message}"
-
-        return True, "Project successfully updated and synced to Google Sheets!"
+        with _writer() as conn:
+            c = conn.cursor()
+            c.execute('''
+                UPDATE projects 
+                SET one_liner = ?,
+                    description = ?,
+                    ai_usage = ?,
+                    lead_name = ?,
+                    whatsapp_contact = ?,
+                    status = ?,
+                    last_updated = CURRENT_TIMESTAMP
+                WHERE project_name = ?
+            ''', (
+                project_data['one_liner'],
+                project_data['description'],
+                project_data['ai_usage'],
+                project_data['lead_name'],
+                project_data['whatsapp_contact'],
+                project_data['status'],
+                project_data['project_name']
+            ))
+            updated = c.rowcount
+        if updated == 0:
+            return False, "Project not found"
+        _get_all_projects.clear()
+
+        # Sync to Google Sheets in the background
+        queue_sheets_sync('update', project_data)
+        return True, "Project successfully updated! Google Sheets will be updated shortly."
     except Exception as e:
         return False, f"Error: {str(e)}"
 
 def add_project(project_data: Dict) -> tuple:
-    """Add new project to database and sync to Google Sheets"""
+    """Add new project to database and queue its sync to Google Sheets"""
     try:
-        conn = sqlite3.connect('ai_projects.db')
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO projects 
-            (project_name, one_liner, description, ai_usage, lead_name, whatsapp_contact, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            project_data['project_name'],
-            project_data['one_liner'],
-            project_data['description'],
-            project_data['ai_usage'],
-            project_data['lead_name'],
-            project_data['whatsapp_contact'],
-            project_data['status']
-        ))
-        conn.commit()
-        conn.close()
-
-        # Sync to Google Sheets
-        sheets_success, sheets_message = sync_to_sheets(project_data)
-        if not sheets_success:
-            return True, f"Project registered in database, but {sheets_message}"
-
-        return True, "Project successfully registered and synced to Google Sheets!"
-    except sqlite3.IntegrityError:
-        return False, "Project name already exists!"
+        with _writer() as conn:
+            c = conn.cursor()
+            c.execute('''
+                INSERT INTO projects 
+                (project_name, one_liner, description, ai_usage, lead_name, whatsapp_contact, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(project_name) DO NOTHING
+                RETURNING id
+            ''', (
+                project_data['project_name'],
+                project_data['one_liner'],
+                project_data['description'],
+                project_data['ai_usage'],
+                project_data['lead_name'],
+                project_data['whatsapp_contact'],
+                project_data['status']
+            ))
+            inserted = c.fetchall()
+        if not inserted:
+            return False, "Project name already exists!"
+        _get_all_projects.clear()
+
+        # Sync to Google Sheets in the background
+        queue_sheets_sync('add', project_data)
+        return True, "Project successfully registered! Google Sheets will be updated shortly."
     except Exception as e:
         return False, f"Error: {str(e)}"
 
 def search_projects(query: str, projects: List[Dict]) -> List[Dict]:
     query = query.lower()
-    return [
-        project for project in projects
-        if query in project['project_name'].lower() or
-        query in project['one_liner'].lower() or
-        query in project['description'].lower() or
-        query in project['lead_name'].lower()
-    ]
+    return [project for project in projects if query in project['_haystack']]
+
+def _rerun_with_message(message: str):
+    """Rerun the whole app after a write so every tab shows fresh data"""
+    st.session_state.flash_message = message
+    st.rerun(scope="app")
+
+def show_flash_message():
+    """Show the message left by the write that triggered this rerun"""
+    message = st.session_state.pop("flash_message", None)
+    if message:
+        st.success(message)
+
+def _tab_fragment(render):
+    """Run a tab as an st.fragment that also reports background sync failures.
+
+    Fragment reruns skip main(), so each tab checks for failures itself.
+    """
+    @functools.wraps(render)
+    def render_tab():
+        show_sheets_sync_failures()
+        render()
+    return st.fragment(render_tab)
+
+@_tab_fragment
+def _view_tab():
+    """View Projects tab"""
+    st.header("AI Projects Overview")
+    
+    # Get all projects
+    projects = get_all_projects()
+    
+    # Calculate metrics
+    status_counts = Counter(p['status'] for p in projects)
+    total_projects = len(projects)
+    idea_projects = status_counts['Idea']
+    mvp_projects = status_counts['MVP']
+    launch_projects = status_counts['Launch']
+    
+    # Create metrics dashboard
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="Total Registered Projects",
+            value=total_projects,
+            help="Total number of projects registered in the system"
+        )
+    
+    with col2:
+        st.metric(
+            label="Projects in Idea Stage",
+            value=idea_projects,
+            help="Projects in initial concept stage"
+        )
+    
+    with col3:
+        st.metric(
+            label="Projects in MVP Stage",
+            value=mvp_projects,
+            help="Projects with working prototype"
+        )
+    
+    with col4:
+        st.metric(
+            label="Projects in Launch Stage",
+            value=launch_projects,
+            help="Projects that are live and being used"
+        )
+    
+    # Add a separator
+    st.divider()
+    
+    # Existing search and project listing
+    search_query = st.text_input("🔍 Search projects", "")
+    
+    if search_query:
+        filtered_projects = search_projects(search_query, projects)
+    else:
+        filtered_projects = projects
+
+    if not filtered_projects:
+        st.info("No projects found.")
+    else:
+        for project in filtered_projects:
+            status_color = PROJECT_STATUSES[project['status']]['color']
+            with st.expander(
+                f"📱 {project['project_name']} - {project['one_liner']} "
+                f"[{project['status']}]"
+            ):
+                cols = st.columns(2)
+                with cols[0]:
+                    st.markdown("**Project Details**")
+                    st.write("**Description:**", project['description'])
+                    st.write("**AI Usage:**", project['ai_usage'])
+                    st.markdown(f"""
+                    **Status:** <span style='color:{status_color}'>{project['status']}</span>
+                    """, unsafe_allow_html=True)
+                    st.info(PROJECT_STATUSES[project['status']]['description'])
+                with cols[1]:
+                    st.markdown("**Contact Information**")
+                    st.write("**Project Lead:**", project['lead_name'])
+                    st.write("**WhatsApp:**", project['whatsapp_contact'])
+                    st.write("**Added on:**", project['date_added'])
+                    if project['last_updated'] != project['date_added']:
+                        st.write("**Last updated:**", project['last_updated'])
+
+@_tab_fragment
+def _register_tab():
+    """Register Project tab"""
+    st.header("Register New AI Project")
+    
+    with st.form("project_registration"):
+        project_name = st.text_input("Project Name*")
+        one_liner = st.text_input("Project One-liner* (max 250 characters)")
+        description = st.text_area("Project Description* (max 100 words)")
+        ai_usage = st.text_area("How AI is Used in the Project*")
+        lead_name = st.text_input("Project Lead Name*")
+        whatsapp_contact = st.text_input("WhatsApp Contact* (format: +[country code][number], e.g., +2347012345678)")
+        
+        # Add status selection with tooltip
+        status = st.selectbox(
+            "Project Status*",
+            options=list(PROJECT_STATUSES.keys()),
+            help="Select the current stage of your project"
+        )
+        st.info(PROJECT_STATUSES[status]['description'])
 
-def main():
-    st.set_page_config(
-        page_title="SuperteamNG AI Guild Projects Tracker",
-        page_icon="🤖",
-        layout="wide"
-    )
+        submitted = st.form_submit_button("Register Project")
 
-    # Initialize database
-    init_db()
+        if submitted:
+            if not all([project_name, one_liner, description, ai_usage, lead_name, whatsapp_contact]):
+                st.error("Please fill all required fields!")
+                return
 
-    # Main navigation
-    st.title("🤖 SuperteamNG AI Guild Project Tracker")
-
-    # Create all tabs
-    tabs = st.tabs(["View Projects", "Register Project", "Edit Projects"])
+            if not validate_one_liner(one_liner):
+                st.error("One-liner exceeds 250 characters!")
+                return
+            
+            if not validate_description(description):
+                st.error("Description exceeds 100 words!")
+                return
+
+            if not validate_whatsapp(whatsapp_contact):
+                st.error("Invalid WhatsApp number format! Use format: +[country code][number]")
+                return
+
+            success, message = add_project({
+                'project_name': project_name,
+                'one_liner': one_liner,
+                'description': description,
+                'ai_usage': ai_usage,
+                'lead_name': lead_name,
+                'whatsapp_contact': whatsapp_contact,
+                'status': status
+            })
+
+            if success:
+                _rerun_with_message(message)
+            else:
+                st.error(message)
 
-    # View Projects Tab
-    # View Projects Tab
-    with tabs[0]:
-        st.header("AI Projects Overview")
+@_tab_fragment
+def _edit_tab():
+    """Edit Projects tab (Protected - Admin Only)"""
+    st.header("Edit Projects")
+    
+    # Add authentication check only for edit tab
+    if not check_password():
+        st.warning("Please log in to access the edit functionality")
+        return
         
-        # Get all projects
-        projects = get_all_projects()
+    # Rest of edit tab content only shown after authentication
+    all_projects = get_all_projects()
+    if not all_projects:
+        st.info("No projects available to edit.")
+        return
         
-        # Calculate metrics
-        total_projects = len(projects)
-        idea_projects = len([p for p in projects if p['status'] == 'Idea'])
-        mvp_projects = len([p for p in projects if p['status'] == 'MVP'])
-        launch_projects = len([p for p in projects if p['status'] == 'Launch'])
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        project_to_edit = st.selectbox(
+            "Select Project to Edit",
+            options=[p['project_name'] for p in all_projects],
+            index=None,
+            placeholder="Choose a project..."
+        )
+    
+    if project_to_edit:
+        with col2:
+            delete_button = st.button("🗑️ Delete Project", type="secondary")
+            
+            if delete_button:
+                st.warning(f"Are you sure you want to delete {project_to_edit}?")
+                confirm_col1, confirm_col2 = st.columns([1, 3])
+                with confirm_col1:
+                    if st.button("Yes, Delete", key="confirm_delete"):
+                        success, message = delete_project(project_to_edit)
+                        if success:
+                            _rerun_with_message(message)
+                        else:
+                            st.error(message)
+                with confirm_col2:
+                    if st.button("Cancel", key="cancel_delete"):
+                        st.rerun()
         
-        # Create metrics dashboard
-        col1, col2, col3, col4 = st.columns(4)
+        current_project = next(p for p in all_projects if p['project_name'] == project_to_edit)
         
-        with col1:
-            st.metric(
-                label="Total Registered Projects",
-                value=total_projects,
-                help="Total number of projects registered in the system"
-            )
+        # Rest of your edit form code remains the same...
+                        
+        # current_project = next(p for p in all_projects if p['project_name'] == project_to_edit)
         
-        with col2:
-            st.metric(
-                label="Projects in Idea Stage",
-                value=idea_projects,
-                help="Projects in initial concept stage"
+        with st.form("project_edit"):
+            # Pre-fill form with current values
+            one_liner = st.text_input(
+                "Project One-liner* (max 250 characters)",
+                value=current_project['one_liner']
             )
-        
-        with col3:
-            st.metric(
-                label="Projects in MVP Stage",
-                value=mvp_projects,
-                help="Projects with working prototype"
+            description = st.text_area(
+                "Project Description* (max 100 words)",
+                value=current_project['description']
             )
-        
-        with col4:
-            st.metric(
-                label="Projects in Launch Stage",
-                value=launch_projects,
-                help="Projects that are live and being used"
+            ai_usage = st.text_area(
+                "How AI is Used in the Project*",
+                value=current_project['ai_usage']
+            )
+            lead_name = st.text_input(
+                "Project Lead Name*",
+                value=current_project['lead_name']
+            )
+            whatsapp_contact = st.text_input(
+                "WhatsApp Contact*",
+                value=current_project['whatsapp_contact']
             )
-        
-        # Add a separator
-        st.divider()
-        
-        # Existing search and project listing
-        search_query = st.text_input("🔍 Search projects", "")
-        
-        if search_query:
-            filtered_projects = search_projects(search_query, projects)
-        else:
-            filtered_projects = projects
-
-        if not filtered_projects:
-            st.info("No projects found.")
-        else:
-            for project in filtered_projects:
-                status_color = PROJECT_STATUSES[project['status']]['color']
-                with st.expander(
-                    f"📱 {project['project_name']} - {project['one_liner']} "
-                    f"[{project['status']}]"
-                ):
-                    cols = st.columns(2)
-                    with cols[0]:
-                        st.markdown("**Project Details**")
-                        st.write("**Description:**", project['description'])
-                        st.write("**AI Usage:**", project['ai_usage'])
-                        st.markdown(f"""
-                        **Status:** <span style='color:{status_color}'>{project['status']}</span>
-                        """, unsafe_allow_html=True)
-                        st.info(PROJECT_STATUSES[project['status']]['description'])
-                    with cols[1]:
-                        st.markdown("**Contact Information**")
-                        st.write("**Project Lead:**", project['lead_name'])
-                        st.write("**WhatsApp:**", project['whatsapp_contact'])
-                        st.write("**Added on:**", project['date_added'])
-                        if project['last_updated'] != project['date_added']:
-                            st.write("**Last updated:**", project['last_updated'])
-
-    # Register Project Tab
-    with tabs[1]:
-        st.header("Register New AI Project")
-        
-        with st.form("project_registration"):
-            project_name = st.text_input("Project Name*")
-            one_liner = st.text_input("Project One-liner* (max 250 characters)")
-            description = st.text_area("Project Description* (max 100 words)")
-            ai_usage = st.text_area("How AI is Used in the Project*")
-            lead_name = st.text_input("Project Lead Name*")
-            whatsapp_contact = st.text_input("WhatsApp Contact* (format: +[country code][number], e.g., +2347012345678)")
-            
-            # Add status selection with tooltip
             status = st.selectbox(
                 "Project Status*",
                 options=list(PROJECT_STATUSES.keys()),
+                index=list(PROJECT_STATUSES.keys()).index(current_project['status']),
                 help="Select the current stage of your project"
             )
             st.info(PROJECT_STATUSES[status]['description'])
 
-            submitted = st.form_submit_button("Register Project")
+            submitted = st.form_submit_button("Update Project")
 
             if submitted:
-                if not all([project_name, one_liner, description, ai_usage, lead_name, whatsapp_contact]):
+                if not all([one_liner, description, ai_usage, lead_name, whatsapp_contact]):
                     st.error("Please fill all required fields!")
                     return
 
-                if not validate_one_liner(one_liner):
-                    st.error("One-liner exceeds 250 characters!")
-                    return
-                
-                if not validate_description(description):
-                    st.error("Description exceeds 100 words!")
-                    return
-
                 if not validate_whatsapp(whatsapp_contact):
                     st.error("Invalid WhatsApp number format! Use format: +[country code][number]")
                     return
 
-                success, message = add_project({
-                    'project_name': project_name,
+                success, message = update_project({
+                    'project_name': project_to_edit,
                     'one_liner': one_liner,
                     'description': description,
                     'ai_usage': ai_usage,
@@ -506,117 +794,40 @@ def main():
                 })
 
                 if success:
-                    st.success(message)
+                    _rerun_with_message(message)
                 else:
                     st.error(message)
 
-    # Edit Projects Tab (Protected - Admin Only)
+def main():
+    st.set_page_config(
+        page_title="SuperteamNG AI Guild Projects Tracker",
+        page_icon="🤖",
+        layout="wide"
+    )
+
+    # Initialize database
+    init_db()
+
+    # Main navigation
+    st.title("🤖 SuperteamNG AI Guild Project Tracker")
+
+    # Confirm the write that triggered this rerun
+    show_flash_message()
+
+    # Create all tabs
+    tabs = st.tabs(["View Projects", "Register Project", "Edit Projects"])
+
+    # View Projects Tab
+    with tabs[0]:
+        _view_tab()
+
+    # Register Project Tab
+    with tabs[1]:
+        _register_tab()
+
     # Edit Projects Tab (Protected - Admin Only)
     with tabs[2]:
-        st.header("Edit Projects")
-        
-        # Add authentication check only for edit tab
-        if not check_password():
-            st.warning("Please log in to access the edit functionality")
-            return
-            
-        # Rest of edit tab content only shown after authentication
-        all_projects = get_all_projects()
-        if not all_projects:
-            st.info("No projects available to edit.")
-            return
-            
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            project_to_edit = st.selectbox(
-                "Select Project to Edit",
-                options=[p['project_name'] for p in all_projects],
-                index=None,
-                placeholder="Choose a project..."
-            )
-        
-        if project_to_edit:
-            with col2:
-                delete_button = st.button("🗑️ Delete Project", type="secondary")
-                
-                if delete_button:
-                    st.warning(f"Are you sure you want to delete {project_to_edit}?")
-                    confirm_col1, confirm_col2 = st.columns([1, 3])
-                    with confirm_col1:
-                        if st.button("Yes, Delete", key="confirm_delete"):
-                            success, message = delete_project(project_to_edit)
-                            if success:
-                                st.success(message)
-                                time.sleep(1)
-                                st.rerun()
-                            else:
-                                st.error(message)
-                    with confirm_col2:
-                        if st.button("Cancel", key="cancel_delete"):
-                            st.rerun()
-            
-            current_project = next(p for p in all_projects if p['project_name'] == project_to_edit)
-            
-            # Rest of your edit form code remains the same...
-                            
-            # current_project = next(p for p in all_projects if p['project_name'] == project_to_edit)
-            
-            with st.form("project_edit"):
-                # Pre-fill form with current values
-                one_liner = st.text_input(
-                    "Project One-liner* (max 250 characters)",
-                    value=current_project['one_liner']
-                )
-                description = st.text_area(
-                    "Project Description* (max 100 words)",
-                    value=current_project['description']
-                )
-                ai_usage = st.text_area(
-                    "How AI is Used in the Project*",
-                    value=current_project['ai_usage']
-                )
-                lead_name = st.text_input(
-                    "Project Lead Name*",
-                    value=current_project['lead_name']
-                )
-                whatsapp_contact = st.text_input(
-                    "WhatsApp Contact*",
-                    value=current_project['whatsapp_contact']
-                )
-                status = st.selectbox(
-                    "Project Status*",
-                    options=list(PROJECT_STATUSES.keys()),
-                    index=list(PROJECT_STATUSES.keys()).index(current_project['status']),
-                    help="Select the current stage of your project"
-                )
-                st.info(PROJECT_STATUSES[status]['description'])
-
-                submitted = st.form_submit_button("Update Project")
-
-                if submitted:
-                    if not all([one_liner, description, ai_usage, lead_name, whatsapp_contact]):
-                        st.error("Please fill all required fields!")
-                        return
-
-                    if not validate_whatsapp(whatsapp_contact):
-                        st.error("Invalid WhatsApp number format! Use format: +[country code][number]")
-                        return
-
-                    success, message = update_project({
-                        'project_name': project_to_edit,
-                        'one_liner': one_liner,
-                        'description': description,
-                        'ai_usage': ai_usage,
-                        'lead_name': lead_name,
-                        'whatsapp_contact': whatsapp_contact,
-                        'status': status
-                    })
-
-                    if success:
-                        st.success(message)
-                    else:
-                        st.error(message)
+        _edit_tab()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file